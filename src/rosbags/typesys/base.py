@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
     from .peg import Visitor
 
+KEYWORDS = frozenset(keyword.kwlist)
+
 
 class TypesysError(Exception):
     """Parser error."""
@@ -29,9 +31,7 @@ def normalize_fieldname(name: str) -> str:
         Normalized name.
 
     """
-    if keyword.iskeyword(name):
-        return f'{name}_'
-    return name
+    return f'{name}_' if name in KEYWORDS else name
 
 
 def parse_message_definition(visitor: Visitor, text: str) -> Typesdict:
@@ -51,7 +51,7 @@ def parse_message_definition(visitor: Visitor, text: str) -> Typesdict:
     try:
         rule = visitor.RULES['specification']
         pos = rule.skip_ws(text, 0)
-        npos, trees = rule.parse(text, pos)
+        npos, trees = rule.parse(text, pos, {})
         assert npos == len(text), f'Could not parse: {text!r}'
         return visitor.visit(trees)  # type: ignore[return-value]
     except Exception as err:
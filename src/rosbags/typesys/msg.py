@@ -13,8 +13,9 @@ Rosbag1 connection information.
 from __future__ import annotations
 
 import re
+import sys
 from enum import IntEnum, auto
-from pathlib import PurePosixPath as Path
+from functools import lru_cache
 from typing import TYPE_CHECKING, cast
 
 from rosbags.interfaces import Nodetype
@@ -44,6 +45,11 @@ if TYPE_CHECKING:
     Field: TypeAlias = 'tuple[Literal[Node.FIELD], tuple[str, FieldDesc]]'
     Msgdesc: TypeAlias = 'tuple[Const | Field, ...]'
 
+BASE: Literal[Nodetype.BASE] = Nodetype.BASE
+NAME: Literal[Nodetype.NAME] = Nodetype.NAME
+ARRAY: Literal[Nodetype.ARRAY] = Nodetype.ARRAY
+SEQUENCE: Literal[Nodetype.SEQUENCE] = Nodetype.SEQUENCE
+
 GRAMMAR_MSG = r"""
 specification
   = msgdef (msgsep msgdef)*
@@ -153,10 +159,10 @@ def normalize_msgtype(name: str) -> str:
         Normalized name.
 
     """
-    path = Path(name)
-    if path.parent.name != 'msg':
-        path = path.parent / 'msg' / path.name
-    return str(path)
+    parent, _, basename = name.rpartition('/')
+    if parent.rpartition('/')[2] == 'msg':
+        return sys.intern(name)
+    return sys.intern(f'{parent}/msg/{basename}' if parent else f'msg/{basename}')
 
 
 def normalize_fieldtype(typename: str, idx: int, field: FieldDesc) -> FieldDesc:
@@ -171,30 +177,33 @@ def normalize_fieldtype(typename: str, idx: int, field: FieldDesc) -> FieldDesc:
         Normalized fieldtype.
 
     """
-    if field[0] == Nodetype.BASE:
+    if field[0] == BASE:
         return field
 
     ftype, args = field
-    ifield = field if ftype == Nodetype.NAME else args[0]
+    ifield = field if ftype == NAME else args[0]
 
-    if ifield[0] == Nodetype.BASE:
+    if ifield[0] == BASE:
         return field
 
     assert isinstance(ifield, tuple)
-    assert ifield[0] == Nodetype.NAME
+    assert ifield[0] == NAME
 
     name = ifield[1]
     if name == 'Header' and not idx:
         name = 'std_msgs/msg/Header'
     elif '/' not in name:
-        name = str(Path(typename).parent / name)
+        if parent := typename.rpartition('/')[0]:
+            name = f'{parent}/{name}'
     elif '/msg/' not in name:
-        name = str((path := Path(name)).parent / 'msg' / path.name)
-    ifield = Nodetype.NAME, name
+        parent, _, basename = name.rpartition('/')
+        name = f'{parent}/msg/{basename}'
+    ifield = NAME, sys.intern(name)
 
-    return ifield if ftype == Nodetype.NAME else (ftype, (ifield, args[1]))  # type: ignore[return-value]
+    return ifield if ftype == NAME else (ftype, (ifield, args[1]))  # type: ignore[return-value]
 
 
+@lru_cache(maxsize=4096)
 def denormalize_msgtype(typename: str) -> str:
     """Undo message tyoename normalization.
 
@@ -206,7 +215,10 @@ def denormalize_msgtype(typename: str) -> str:
 
     """
     assert '/msg/' in typename
-    return str((path := Path(typename)).parent.parent / path.name)
+    parent, _, basename = typename.rpartition('/')
+    if grandparent := parent.rpartition('/')[0]:
+        return f'{grandparent}/{basename}'
+    return basename
 
 
 class Node(IntEnum):
@@ -217,7 +229,12 @@ class Node(IntEnum):
 
 
 class VisitorMSG(Visitor):
-    """MSG file visitor."""
+    """MSG file visitor.
+
+    The visitor keeps no state between parses, a single instance is shared by
+    all calls to :func:`get_types_from_msg`.
+
+    """
 
     RULES = parse_grammar(GRAMMAR_MSG, re.compile(r'(\s|#[^\n]*$)+', re.M | re.S))
 
@@ -295,22 +312,22 @@ class VisitorMSG(Visitor):
     ) -> FieldDesc:
         """Process array type specifier."""
         if length := children[1][1]:
-            return Nodetype.ARRAY, (children[0], length[0])
-        return Nodetype.SEQUENCE, (children[0], 0)
+            return ARRAY, (children[0], length[0])
+        return SEQUENCE, (children[0], 0)
 
     def visit_bounded_array_type_spec(
         self,
         children: tuple[BaseDesc | NameDesc, tuple[L, int, L]],
     ) -> FieldDesc:
         """Process bounded array type specifier."""
-        return Nodetype.SEQUENCE, (children[0], children[1][1])
+        return SEQUENCE, (children[0], children[1][1])
 
     def visit_simple_type_spec(self, children: NameDesc | tuple[L, L, int]) -> BaseDesc | NameDesc:
         """Process simple type specifier."""
         if len(children) == 3:
             assert children[1] == (Rule.LIT, '<=')
             assert isinstance(children[2], int)
-            return Nodetype.BASE, ('string', children[2])
+            return BASE, ('string', children[2])
         typespec = children[1]
         assert isinstance(typespec, str)
         dct: dict[str, str] = {
@@ -319,22 +336,22 @@ class VisitorMSG(Visitor):
         }
         typespec = dct.get(typespec, typespec)
         if typespec in VisitorMSG.BASETYPES:
-            return Nodetype.BASE, (cast('Basename', typespec), 0)
-        return Nodetype.NAME, typespec
+            return BASE, (cast('Basename', typespec), 0)
+        return NAME, typespec
 
     def visit_scoped_name(self, children: NameDesc | tuple[NameDesc, L, NameDesc]) -> NameDesc:
         """Process scoped name."""
         if len(children) == 2:
             return children
-        return Nodetype.NAME, f'{children[0][1]}/{children[2][1]}'
+        return NAME, sys.intern(f'{children[0][1]}/{children[2][1]}')
 
     def visit_identifier(self, children: str) -> NameDesc:
         """Process identifier."""
-        return Nodetype.NAME, children
+        return NAME, children
 
     def visit_boolean_literal(self, children: str) -> bool:
         """Process boolean literal."""
-        return children.lower() in {'true', '1'}
+        return children[0] in {'t', 'T', '1'}
 
     def visit_float_literal(self, children: str) -> float:
         """Process float literal."""
@@ -357,6 +374,9 @@ class VisitorMSG(Visitor):
         return children[1]
 
 
+VISITOR_MSG = VisitorMSG()
+
+
 def get_types_from_msg(text: str, name: str) -> Typesdict:
     """Get type from msg message definition.
 
@@ -368,4 +388,4 @@ def get_types_from_msg(text: str, name: str) -> Typesdict:
         list with single message name and parsetree.
 
     """
-    return parse_message_definition(VisitorMSG(), f'MSG: {name}\n{text}')
+    return parse_message_definition(VISITOR_MSG, f'MSG: {name}\n{text}')
@@ -32,6 +32,7 @@ if TYPE_CHECKING:
         data: Tree
 
     Tree: TypeAlias = 'tuple[Tree, ...] | Node | str'
+    Memo: TypeAlias = 'dict[tuple[str, int], tuple[int, Tree]]'
 
 
 class Rule:
@@ -59,17 +60,18 @@ class Rule:
         self.rules = rules
         self.name = name
         self.whitespace = whitespace
+        self.match_ws = whitespace.match
 
     def skip_ws(self, text: str, pos: int) -> int:
         """Skip whitespace."""
-        match = self.whitespace.match(text, pos)
-        return match.span()[1] if match else pos
+        match = self.match_ws(text, pos)
+        return match.end() if match else pos
 
     def make_node(self, data: Tree) -> Tree:
         """Make node for parse tree."""
         return {'node': self.name, 'data': data} if self.name else data
 
-    def parse(self, text: str, pos: int) -> tuple[int, Tree]:
+    def parse(self, text: str, pos: int, memo: Memo) -> tuple[int, Tree]:
         """Apply rule at position."""
         raise NotImplementedError  # pragma: no cover
 
@@ -99,13 +101,11 @@ class RuleLiteral(Rule):
         self.value = value[1:-1].replace("\\'", "'")
 
     @override
-    def parse(self, text: str, pos: int) -> tuple[int, Tree]:
+    def parse(self, text: str, pos: int, memo: Memo) -> tuple[int, Tree]:
         """Apply rule at position."""
         value = self.value
-        assert isinstance(value, str)
-        if text[pos : pos + len(value)] == value:
-            npos = pos + len(value)
-            npos = self.skip_ws(text, npos)
+        if text.startswith(value, pos):
+            npos = self.skip_ws(text, pos + len(value))
             return npos, (self.LIT, value)
         return -1, ()
 
@@ -133,27 +133,35 @@ class RuleRegex(Rule):
         """
         super().__init__(value, rules, whitespace, name)
         self.value = re.compile(value[2:-1], re.M | re.S)
+        self.match = self.value.match
 
     @override
-    def parse(self, text: str, pos: int) -> tuple[int, Tree]:
+    def parse(self, text: str, pos: int, memo: Memo) -> tuple[int, Tree]:
         """Apply rule at position."""
-        match = self.value.match(text, pos)
+        match = self.match(text, pos)
         if not match:
             return -1, ()
-        npos = self.skip_ws(text, match.span()[1])
+        npos = self.skip_ws(text, match.end())
         return npos, self.make_node(match.group())
 
 
 class RuleToken(Rule):
-    """Rule to match token."""
+    """Rule to match token.
+
+    Results are memoized per position, so alternatives sharing a prefix do
+    not parse the same input repeatedly.
+
+    """
 
     value: str
 
     @override
-    def parse(self, text: str, pos: int) -> tuple[int, Tree]:
+    def parse(self, text: str, pos: int, memo: Memo) -> tuple[int, Tree]:
         """Apply rule at position."""
-        token = self.rules[self.value]
-        npos, data = token.parse(text, pos)
+        key = self.value, pos
+        if key not in memo:
+            memo[key] = self.rules[self.value].parse(text, pos, memo)
+        npos, data = memo[key]
         if npos == -1:
             return npos, data
         return npos, self.make_node(data)
@@ -165,10 +173,10 @@ class RuleOneof(Rule):
     value: list[Rule]
 
     @override
-    def parse(self, text: str, pos: int) -> tuple[int, Tree]:
+    def parse(self, text: str, pos: int, memo: Memo) -> tuple[int, Tree]:
         """Apply rule at position."""
         for value in self.value:
-            npos, data = value.parse(text, pos)
+            npos, data = value.parse(text, pos, memo)
             if npos != -1:
                 return npos, self.make_node(data)
         return -1, ()
@@ -180,12 +188,12 @@ class RuleSequence(Rule):
     value: list[Rule]
 
     @override
-    def parse(self, text: str, pos: int) -> tuple[int, Tree]:
+    def parse(self, text: str, pos: int, memo: Memo) -> tuple[int, Tree]:
         """Apply rule at position."""
         data: list[Tree] = []
         npos = pos
         for value in self.value:
-            npos, node = value.parse(text, npos)
+            npos, node = value.parse(text, npos, memo)
             if npos == -1:
                 return -1, ()
             data.append(node)
@@ -198,12 +206,12 @@ class RuleZeroPlus(Rule):
     value: Rule
 
     @override
-    def parse(self, text: str, pos: int) -> tuple[int, Tree]:
+    def parse(self, text: str, pos: int, memo: Memo) -> tuple[int, Tree]:
         """Apply rule at position."""
         data: list[Tree] = []
         lpos = pos
         while True:
-            npos, node = self.value.parse(text, lpos)
+            npos, node = self.value.parse(text, lpos, memo)
             if npos == -1:
                 return lpos, self.make_node(tuple(data))
             data.append(node)
@@ -216,15 +224,15 @@ class RuleOnePlus(Rule):
     value: Rule
 
     @override
-    def parse(self, text: str, pos: int) -> tuple[int, Tree]:
+    def parse(self, text: str, pos: int, memo: Memo) -> tuple[int, Tree]:
         """Apply rule at position."""
-        npos, node = self.value.parse(text, pos)
+        npos, node = self.value.parse(text, pos, memo)
         if npos == -1:
             return -1, ()
         data = [node]
         lpos = npos
         while True:
-            npos, node = self.value.parse(text, lpos)
+            npos, node = self.value.parse(text, lpos, memo)
             if npos == -1:
                 return lpos, self.make_node(tuple(data))
             data.append(node)
@@ -237,9 +245,9 @@ class RuleZeroOne(Rule):
     value: Rule
 
     @override
-    def parse(self, text: str, pos: int) -> tuple[int, Tree]:
+    def parse(self, text: str, pos: int, memo: Memo) -> tuple[int, Tree]:
         """Apply rule at position."""
-        npos, node = self.value.parse(text, pos)
+        npos, node = self.value.parse(text, pos, memo)
         if npos == -1:
             return pos, self.make_node(())
         return npos, self.make_node((node,))
@@ -257,11 +265,14 @@ class Visitor:
 
     def __init__(self) -> None:
         """Initialize."""
+        self.dispatch: dict[str, Callable[[Tree], Tree]] = {
+            name[6:]: getattr(self, name) for name in dir(self) if name.startswith('visit_')
+        }
 
     def visit(self, tree: Tree) -> Tree:
         """Visit all nodes in parse tree."""
         if isinstance(tree, tuple):
-            return tuple(self.visit(x) for x in tree)
+            return tuple([self.visit(x) for x in tree])
 
         if isinstance(tree, str):
             return tree
@@ -270,13 +281,15 @@ class Visitor:
         assert list(tree.keys()) == ['node', 'data'], tree.keys()
 
         tree['data'] = self.visit(tree['data'])
-        func: Callable[[Tree], Tree] = getattr(self, f'visit_{tree["node"]}', identity)
-        return func(tree['data'])
+        return self.dispatch.get(tree['node'], identity)(tree['data'])
+
+
+RXTOKEN = re.compile(r'(^\()|(\)(?=[*+?]?$))|([*+?]$)')
 
 
 def split_token(tok: str) -> list[str]:
     """Split repetition and grouping tokens."""
-    return list(filter(None, re.split(r'(^\()|(\)(?=[*+?]?$))|([*+?]$)', tok)))
+    return list(filter(None, RXTOKEN.split(tok)))
 
 
 def collapse_tokens(
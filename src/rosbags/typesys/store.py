@@ -8,7 +8,6 @@ import json
 import sys
 from hashlib import md5, sha256
 from importlib.util import module_from_spec, spec_from_loader
-from itertools import starmap
 from struct import pack_into
 from typing import TYPE_CHECKING, Protocol, TypeVar, cast
 
@@ -101,6 +100,68 @@ TIDMAP = {
     # Unsupported 'bounded_wstring': 22,
 }
 
+TYPEMAP_ROS1 = {
+    'builtin_interfaces/msg/Time': 'time',
+    'builtin_interfaces/msg/Duration': 'duration',
+}
+TYPEMAP_ROS2: dict[str, str] = {}
+
+MSG_HEADER = f'{"=" * 80}\nMSG: '
+
+TID_INCREMENT = {
+    (Nodetype.ARRAY, False): 48,
+    (Nodetype.ARRAY, True): 48,
+    (Nodetype.SEQUENCE, True): 96,
+    (Nodetype.SEQUENCE, False): 144,
+}
+
+EMPTY_MEMBERS: tuple[tuple[str, FieldDesc], ...] = (
+    ('structure_needs_at_least_one_member', (Nodetype.BASE, ('uint8', 0))),
+)
+
+
+def get_field_description(name: str, desc: FieldDesc) -> Field:
+    """Get RIHS01 field description.
+
+    Args:
+        name: Field name.
+        desc: Field type descriptor.
+
+    Returns:
+        Field description.
+
+    """
+    string_capacity = 0
+    subtype = ''
+    if desc[0] == Nodetype.ARRAY or desc[0] == Nodetype.SEQUENCE:
+        (typ, rest), capacity = desc[1]
+        increment = TID_INCREMENT[desc[0], bool(capacity)]
+    else:
+        typ, rest = desc
+        increment = capacity = 0
+
+    if typ == Nodetype.NAME:
+        tid = increment + 1
+        assert isinstance(rest, str)
+        subtype = sys.intern(rest)
+    elif rest[0] == 'string' and rest[1]:
+        assert isinstance(rest[1], int)
+        string_capacity = rest[1]
+        tid = increment + TIDMAP['bounded_string']
+    else:
+        assert isinstance(rest[0], str)
+        tid = increment + TIDMAP[rest[0]]
+
+    return {
+        'name': name,
+        'type': {
+            'type_id': tid,
+            'capacity': capacity,
+            'string_capacity': string_capacity,
+            'nested_type_name': subtype,
+        },
+    }
+
 
 class Typestore:
     """Type store."""
@@ -111,6 +172,9 @@ class Typestore:
     def __init__(self, base: ModuleType | None = None) -> None:
         """Initialize."""
         self.cache: dict[str, Msgdef[object]] = {}
+        self.defhash_cache: dict[tuple[str, int], tuple[str, str, dict[str, tuple[str, str]]]] = {}
+        self.rihs01_cache: dict[str, str] = {}
+        self.struct_cache: dict[str, Struct] = {}
         self.types = {}
         self.fielddefs = {}
         if base:
@@ -358,24 +422,95 @@ class Typestore:
             TypesysError: Type does not exist.
 
         """
-        typemap = (
-            {'builtin_interfaces/msg/Time': 'time', 'builtin_interfaces/msg/Duration': 'duration'}
-            if ros_version == 1
-            else {}
-        )
+        key = (typename, ros_version)
+        if key not in self.defhash_cache:
+            if self._has_cycle(typename, set(), set()):
+                # Results for types that reach a recursive type depend on where
+                # the cycle was entered, they are never cached.
+                return self._gendefhash(typename, subdefs, ros_version)
+            childdefs: dict[str, tuple[str, str]] = {}
+            deftext, md5sum = self._gendefhash(typename, childdefs, ros_version)
+            self.defhash_cache[key] = deftext, md5sum, childdefs
+
+        deftext, md5sum, childdefs = self.defhash_cache[key]
+        for name, value in childdefs.items():
+            if name not in subdefs:
+                subdefs[name] = value
+        return deftext, md5sum
+
+    def _has_cycle(self, typename: str, path: set[str], done: set[str]) -> bool:
+        """Check if a cycle is reachable from type."""
+        if typename in path:
+            return True
+        if typename in done or typename not in self.fielddefs:
+            return False
+
+        path.add(typename)
+        for _, desc in self.fielddefs[typename][1]:
+            sub = desc[1][0] if desc[0] == Nodetype.ARRAY or desc[0] == Nodetype.SEQUENCE else desc
+            if sub[0] == Nodetype.NAME and self._has_cycle(sub[1], path, done):
+                return True
+        path.remove(typename)
+        done.add(typename)
+        return False
+
+    def _gendefhash(
+        self,
+        typename: str,
+        subdefs: dict[str, tuple[str, str]],
+        ros_version: int,
+    ) -> tuple[str, str]:
+        """Generate uncached message definition and hash for type."""
+        deftext, rows = self._render_fields(typename, ros_version)
 
-        deftext: list[str] = []
         hashtext: list[str] = []
-        if typename not in self.fielddefs:
+        for text, subname in rows:
+            if not subname:
+                hashtext.append(text)
+                continue
+            if subname not in subdefs:
+                subdefs[subname] = ('', '')
+                subdefs[subname] = self.gendefhash(subname, subdefs, ros_version)
+            hashtext.append(f'{subdefs[subname][1]} {text}')
+
+        return deftext, md5('\n'.join(hashtext).encode(), usedforsecurity=False).hexdigest()
+
+    def _render_fields(
+        self,
+        typename: str,
+        ros_version: int,
+    ) -> tuple[str, list[tuple[str, str]]]:
+        """Render static parts of message definition and hash text.
+
+        Hash lines of nested types depend on the hash of the nested type, for
+        these only the field name and the nested typename are returned.
+
+        Args:
+            typename: Name of type to render.
+            ros_version: ROS version number.
+
+        Returns:
+            Message definition and hash lines with optional nested typenames.
+
+        Raises:
+            TypesysError: Type does not exist.
+
+        """
+        typemap = TYPEMAP_ROS1 if ros_version == 1 else TYPEMAP_ROS2
+
+        deftext: list[str] = []
+        rows: list[tuple[str, str]] = []
+        if not (fielddefs := self.fielddefs.get(typename)):
             msg = f'Type {typename!r} is unknown.'
             raise TypesysError(msg)
 
-        for name, typ, value in self.fielddefs[typename][0]:
-            stripped_name = name.rstrip('_')
-            deftext.append(f'{typ} {stripped_name}={value}')
-            hashtext.append(f'{typ} {stripped_name}={value}')
+        consts, fields = fielddefs
+        for name, typ, value in consts:
+            line = f'{typ} {name.rstrip("_")}={value}'
+            deftext.append(line)
+            rows.append((line, ''))
 
-        for name, desc in self.fielddefs[typename][1]:
+        for name, desc in fields:
             if name == 'structure_needs_at_least_one_member':
                 continue
             stripped_name = name.rstrip('_')
@@ -384,49 +519,45 @@ class Typestore:
                 argname, arglimit = desc[1]
                 if argname == 'string':
                     argname = f'string<={arglimit}' if arglimit else 'string'
-                deftext.append(f'{argname} {stripped_name}')
-                hashtext.append(f'{argname} {stripped_name}')
-            elif desc[0] == int(Nodetype.NAME):
+                line = f'{argname} {stripped_name}'
+                deftext.append(line)
+                rows.append((line, ''))
+            elif desc[0] == Nodetype.NAME:
                 args = desc[1]
                 assert isinstance(args, str)
                 subname = args
                 if subname in typemap:
-                    deftext.append(f'{typemap[subname]} {stripped_name}')
-                    hashtext.append(f'{typemap[subname]} {stripped_name}')
+                    line = f'{typemap[subname]} {stripped_name}'
+                    deftext.append(line)
+                    rows.append((line, ''))
                 else:
-                    if subname not in subdefs:
-                        subdefs[subname] = ('', '')
-                        subdefs[subname] = self.gendefhash(subname, subdefs, ros_version)
                     deftext.append(f'{denormalize_msgtype(subname)} {stripped_name}')
-                    hashtext.append(f'{subdefs[subname][1]} {stripped_name}')
+                    rows.append((stripped_name, sys.intern(subname)))
             else:
-                assert desc[0] in {Nodetype.ARRAY, Nodetype.SEQUENCE}
+                assert desc[0] == Nodetype.ARRAY or desc[0] == Nodetype.SEQUENCE
                 assert isinstance(desc[1], tuple)
                 subdesc, num = desc[1]
                 isubname: tuple[str, int] | str
                 isubtype, isubname = subdesc
-                count = (
-                    '' if num == 0 else str(num) if desc[0] == int(Nodetype.ARRAY) else f'<={num}'
-                )
-                if isubtype == int(Nodetype.BASE):
+                count = '' if num == 0 else str(num) if desc[0] == Nodetype.ARRAY else f'<={num}'
+                if isubtype == Nodetype.BASE:
                     if isubname[0] == 'string':
                         isubname = (f'string<={isubname[1]}' if isubname[1] else 'string', 0)
-                    deftext.append(f'{isubname[0]}[{count}] {stripped_name}')
-                    hashtext.append(f'{isubname[0]}[{count}] {stripped_name}')
+                    line = f'{isubname[0]}[{count}] {stripped_name}'
+                    deftext.append(line)
+                    rows.append((line, ''))
                 elif isubname in typemap:
                     assert isinstance(isubname, str)
-                    deftext.append(f'{typemap[isubname]}[{count}] {stripped_name}')
-                    hashtext.append(f'{typemap[isubname]}[{count}] {stripped_name}')
+                    line = f'{typemap[isubname]}[{count}] {stripped_name}'
+                    deftext.append(line)
+                    rows.append((line, ''))
                 else:
                     assert isinstance(isubname, str)
-                    if isubname not in subdefs:
-                        subdefs[isubname] = ('', '')
-                        subdefs[isubname] = self.gendefhash(isubname, subdefs, ros_version)
                     deftext.append(f'{denormalize_msgtype(isubname)}[{count}] {stripped_name}')
-                    hashtext.append(f'{subdefs[isubname][1]} {stripped_name}')
+                    rows.append((stripped_name, sys.intern(isubname)))
 
         deftext.append('')
-        return '\n'.join(deftext), md5('\n'.join(hashtext).encode()).hexdigest()  # noqa: S324
+        return '\n'.join(deftext), rows
 
     def generate_msgdef(
         self,
@@ -447,14 +578,10 @@ class Typestore:
         subdefs: dict[str, tuple[str, str]] = {}
         msgdef, md5sum = self.gendefhash(typename, subdefs, ros_version)
 
-        msgdef = ''.join(
-            [
-                msgdef,
-                *[f'{"=" * 80}\nMSG: {denormalize_msgtype(k)}\n{v[0]}' for k, v in subdefs.items()],
-            ],
-        )
-
-        return msgdef, md5sum
+        parts = [msgdef]
+        for name, (subdef, _) in subdefs.items():
+            parts += (MSG_HEADER, denormalize_msgtype(name), '\n', subdef)
+        return ''.join(parts), md5sum
 
     def hash_rihs01(self, typ: str) -> str:
         """Hash message definition.
@@ -466,77 +593,43 @@ class Typestore:
             Hash value.
 
         """
+        if typ not in self.rihs01_cache:
+            self.rihs01_cache[typ] = self._hash_rihs01(typ)
+        return self.rihs01_cache[typ]
 
-        def get_field(name: str, desc: FieldDesc) -> Field:
-            increment = 0
-            capacity = 0
-            string_capacity = 0
-            subtype = ''
-            if desc[0] == Nodetype.ARRAY:
-                increment = 48
-                capacity = desc[1][1]
-                typ, rest = desc[1][0]
-            elif desc[0] == Nodetype.SEQUENCE:
-                count = desc[1][1]
-                if count:
-                    increment = 96
-                    capacity = count
-                else:
-                    increment = 144
-                typ, rest = desc[1][0]
-            else:
-                typ, rest = desc
-
-            if typ == Nodetype.NAME:
-                tid = increment + 1
-                assert isinstance(rest, str)
-                subtype = rest
-                _ = get_struct(subtype)
-            elif rest[0] == 'string' and rest[1]:
-                assert isinstance(rest[1], int)
-                string_capacity = rest[1]
-                tid = increment + TIDMAP['bounded_string']
-            else:
-                assert isinstance(rest[0], str)
-                tid = increment + TIDMAP[rest[0]]
-
-            return {
-                'name': name,
-                'type': {
-                    'type_id': tid,
-                    'capacity': capacity,
-                    'string_capacity': string_capacity,
-                    'nested_type_name': subtype,
-                },
-            }
-
+    def _hash_rihs01(self, typ: str) -> str:
+        """Hash uncached message definition."""
         struct_cache: dict[str, Struct] = {}
-
-        def get_struct(typ: str) -> Struct:
-            if typ not in struct_cache:
-                struct_cache[typ] = {
-                    'type_name': typ,
-                    'fields': list(
-                        starmap(
-                            get_field,
-                            self.fielddefs[typ][1]
-                            or [
-                                (
-                                    'structure_needs_at_least_one_member',
-                                    (Nodetype.BASE, ('uint8', 0)),
-                                )
-                            ],
-                        )
-                    ),
-                }
-            return struct_cache[typ]
+        self._collect_structs(typ, struct_cache)
 
         dct = {
-            'type_description': get_struct(typ),
+            'type_description': struct_cache[typ],
             'referenced_type_descriptions': [
-                y for x, y in sorted(struct_cache.items()) if x != typ
+                struct_cache[x] for x in sorted(struct_cache) if x != typ
             ],
         }
 
-        digest = sha256(json.dumps(dct).encode()).hexdigest()
+        digest = sha256(
+            json.dumps(dct, check_circular=False).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
         return f'RIHS01_{digest}'
+
+    def _collect_structs(self, typ: str, struct_cache: dict[str, Struct]) -> None:
+        """Collect type descriptions of type and all nested types."""
+        if typ in struct_cache:
+            return
+
+        if typ not in self.struct_cache:
+            self.struct_cache[typ] = {
+                'type_name': typ,
+                'fields': [
+                    get_field_description(name, desc)
+                    for name, desc in self.fielddefs[typ][1] or EMPTY_MEMBERS
+                ],
+            }
+
+        struct = struct_cache[typ] = self.struct_cache[typ]
+        for field in struct['fields']:
+            if subtype := field['type']['nested_type_name']:
+                self._collect_structs(subtype, struct_cache)
@@ -64,6 +64,69 @@ def test_generate_msgdef() -> None:
         _ = store.generate_msgdef('foo_msgs/msg/Badname')
 
 
+def test_generate_msgdef_cached() -> None:
+    """Test typestore message definitions do not depend on call order."""
+    for ros_version in (1, 2):
+        store = get_typestore(Stores.ROS1_NOETIC)
+        fresh = get_typestore(Stores.ROS1_NOETIC)
+
+        _ = store.generate_msgdef('geometry_msgs/msg/PoseWithCovariance', ros_version)
+        _ = store.generate_msgdef('std_msgs/msg/Header', ros_version)
+        for typename in ('nav_msgs/msg/Odometry', 'geometry_msgs/msg/PoseWithCovariance'):
+            res = store.generate_msgdef(typename, ros_version)
+            assert res == fresh.generate_msgdef(typename, ros_version)
+            assert res == store.generate_msgdef(typename, ros_version)
+
+
+def test_generate_msgdef_recursive() -> None:
+    """Test typestore generates message definitions for recursive types."""
+    for ros_version in (1, 2):
+        store = get_typestore(Stores.ROS1_NOETIC)
+        fresh = get_typestore(Stores.ROS1_NOETIC)
+        for typestore in (store, fresh):
+            typestore.register(get_types_from_msg('int8 a\nNode[] children', 'test_msgs/msg/Node'))
+            typestore.register(get_types_from_msg('Node node', 'test_msgs/msg/Tree'))
+
+        _ = store.generate_msgdef('test_msgs/msg/Node', ros_version)
+        res = store.generate_msgdef('test_msgs/msg/Tree', ros_version)
+        assert res == fresh.generate_msgdef('test_msgs/msg/Tree', ros_version)
+
+        res = store.generate_msgdef('test_msgs/msg/Node', ros_version)
+        assert res[0].split(f'{"=" * 80}\n') == [
+            'int8 a\ntest_msgs/Node[] children\n',
+            'MSG: test_msgs/Node\nint8 a\ntest_msgs/Node[] children\n',
+        ]
+        assert res[1] == 'd014b48e4319be38fdca01408d00bc8e'
+
+
+def test_generate_msgdef_reaches_recursive() -> None:
+    """Test typestore generates message definitions for types reaching recursive types."""
+    typs = {
+        'test_msgs/msg/A': 'B[] b',
+        'test_msgs/msg/B': 'B[] b',
+        'test_msgs/msg/C': 'D d',
+        'test_msgs/msg/D': 'E e',
+        'test_msgs/msg/E': 'D d',
+        'test_msgs/msg/P': 'E e\nC c',
+    }
+    for ros_version in (1, 2):
+        store = get_typestore(Stores.EMPTY)
+        fresh = get_typestore(Stores.EMPTY)
+        for typestore in (store, fresh):
+            for name, text in typs.items():
+                typestore.register(get_types_from_msg(text, name))
+
+        for typename in ('test_msgs/msg/B', 'test_msgs/msg/A', 'test_msgs/msg/C'):
+            _ = store.generate_msgdef(typename, ros_version)
+        for typename, digest in (
+            ('test_msgs/msg/P', 'c3c7e0b2782c2c66b0b798f22598cb14'),
+            ('test_msgs/msg/A', 'a01e1144df84ea2fcc6b6bf36bd8079b'),
+        ):
+            res = store.generate_msgdef(typename, ros_version)
+            assert res == fresh.generate_msgdef(typename, ros_version)
+            assert res[1] == digest
+
+
 def test_ros1md5() -> None:
     """Test typestore hashes with MD5."""
     store = get_typestore(Stores.LATEST)
@@ -103,3 +166,22 @@ def test_rihs01() -> None:
         store.hash_rihs01('test_msgs/msg/Hash')
         == 'RIHS01_6f444494cb202f5c8dc6f92c98f4c60b926f1b24a3dc1cabfa7fbd35c72e246a'
     )
+
+    store.register(get_types_from_msg('int32[0] empty', 'test_msgs/msg/EmptyArray'))
+    assert (
+        store.hash_rihs01('test_msgs/msg/EmptyArray')
+        == 'RIHS01_356ae8a0654f289c9471017f7b7315af7587aeca6237e9d7512082ff9eff2f66'
+    )
+
+
+def test_rihs01_cached() -> None:
+    """Test typestore reuses cached RIHS01 hashes."""
+    store = get_typestore(Stores.LATEST)
+    fresh = get_typestore(Stores.LATEST)
+
+    _ = store.hash_rihs01('geometry_msgs/msg/PoseStamped')
+    assert 'std_msgs/msg/Header' in store.struct_cache
+
+    for typename in ('std_msgs/msg/Header', 'nav_msgs/msg/Odometry'):
+        assert store.hash_rihs01(typename) == fresh.hash_rihs01(typename)
+        assert typename in store.rihs01_cache
@@ -6,6 +6,7 @@ import pytest
 
 from rosbags.interfaces import Nodetype
 from rosbags.typesys import Stores, TypesysError, get_types_from_msg, get_typestore
+from rosbags.typesys.msg import denormalize_msgtype, normalize_msgtype
 
 MSG = """
 # comment
@@ -96,12 +97,37 @@ int8 data
 """
 
 
+def test_msgtype_normalization() -> None:
+    """Test message typename normalization roundtrips."""
+    assert normalize_msgtype('std_msgs/Header') == 'std_msgs/msg/Header'
+    assert normalize_msgtype('std_msgs/msg/Header') == 'std_msgs/msg/Header'
+    assert normalize_msgtype('ns/pkg/Foo') == 'ns/pkg/msg/Foo'
+    assert normalize_msgtype('Foo') == 'msg/Foo'
+
+    assert denormalize_msgtype('std_msgs/msg/Header') == 'std_msgs/Header'
+    assert denormalize_msgtype('ns/pkg/msg/Foo') == 'ns/pkg/Foo'
+
+
 def test_msg_parser_raises_on_bad_definition() -> None:
     """Test msg parser raises on bad definition."""
     with pytest.raises(TypesysError, match='Could not parse'):
         _ = get_types_from_msg('invalid', 'test_msgs/msg/Foo')
 
 
+def test_msg_parser_accepts_boolean_literals() -> None:
+    """Test msg parser accepts boolean literals in any case."""
+    ret = get_types_from_msg(
+        'bool a=True\nbool b=FALSE\nbool c=true\nbool d=false', 'test_msgs/Bool'
+    )
+    consts, _ = ret['test_msgs/msg/Bool']
+    assert consts == [
+        ('a', 'bool', True),
+        ('b', 'bool', False),
+        ('c', 'bool', True),
+        ('d', 'bool', False),
+    ]
+
+
 def test_msg_parser_accepts_empty_definition() -> None:
     """Test msg parser accepts empty message definition."""
     ret = get_types_from_msg('', 'std_msgs/msg/Empty')